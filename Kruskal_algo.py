@@ -5,90 +5,389 @@ Author: Prathi Patil S
 Date: 2025-10-15
 
 Notes:
-- Uses built-in Python sorting; no custom sort implementation required.
+- Edges are stored as three parallel NumPy arrays (weights, u, v) and sorted
+  with a stable NumPy argsort; no custom sort implementation required.
 - Employs a Union-Find (Disjoint Set) data structure for cycle detection.
+- The main loop is compiled with Numba when it is installed; without Numba
+  the Cython build in kruskal_cy.pyx is used if compiled, otherwise the same
+  code runs in the interpreter.
 """
 
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 import time
 import math
-import random
+import functools
 import gc
+import numpy as np
 import matplotlib.pyplot as plt
 import unittest
+from unittest import mock
+import types
+
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import reverse_cuthill_mckee
+except ImportError:  # SciPy is optional; vertex relabelling is skipped without it
+    reverse_cuthill_mckee = None
+
+try:
+    import cudf
+    import cugraph
+except ImportError:  # RAPIDS is optional; the 'cuda' backend falls back to the CPU path
+    cugraph = None
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; run the kernels as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 
 class UnionFind:
     #Union-Find (Disjoint Set)) with path compression and union by rank.
     def __init__(self, size: int) -> None:
-        self.parent: List[int] = list(range(size))
-        self.rank: List[int] = [0] * size
+        self.parent: np.ndarray = np.arange(size, dtype=np.int32)
+        self.rank: np.ndarray = np.zeros(size, dtype=np.uint8) # rank <= log2(size) fits in a byte
 
-    def find(self, node: int) -> int: #Find node with path compression.
-        if self.parent[node] != node:
-            self.parent[node] = self.find(self.parent[node])
-        return self.parent[node]
+    def find(self, node: int) -> int: #Find node with path splitting (iterative, no recursion).
+        parent = self.parent
+        while parent[node] != node:
+            parent[node], node = parent[parent[node]], parent[node]
+        return int(node)
 
     def union(self, a: int, b: int) -> bool: #Union the sets of a and b
-        root_a = self.find(a)
-        root_b = self.find(b)
+        find = self.find
+        root_a = find(a)
+        root_b = find(b)
         if root_a == root_b:
             return False # Already connected
-        if self.rank[root_a] < self.rank[root_b]:
-            self.parent[root_a] = root_b
-        elif self.rank[root_a] > self.rank[root_b]:
-            self.parent[root_b] = root_a
-        else:
-            self.parent[root_b] = root_a
-            self.rank[root_a] += 1
+        self.link(root_a, root_b)
         return True
 
+    def link(self, root_a: int, root_b: int) -> None: #Union two distinct roots by rank, no find calls
+        parent = self.parent
+        rank = self.rank
+        rank_a = rank[root_a]
+        rank_b = rank[root_b]
+        if rank_a < rank_b:
+            parent[root_a] = root_b
+        elif rank_a > rank_b:
+            parent[root_b] = root_a
+        else:
+            parent[root_b] = root_a
+            rank[root_a] = rank_a + 1
+
+
+@njit(cache=True)
+def _find_root(parent: np.ndarray, x: int) -> int: # Iterative find with path halving
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+@njit(cache=True)
+def _kruskal_core(w: np.ndarray, u: np.ndarray, v: np.ndarray,
+                  parent: np.ndarray, rank: np.ndarray, n: int,
+                  out_w: np.ndarray, out_u: np.ndarray, out_v: np.ndarray,
+                  count: int) -> Tuple[int, int]:
+    """Scan weight-sorted edges, appending accepted ones to out_* after the first `count`
+    entries; returns (new count, weight added by this call)."""
+    total_weight = np.int64(0) # 64-bit even when run as plain Python on int32 weights
+    for i in range(w.shape[0]):
+        root_u = _find_root(parent, u[i])
+        root_v = _find_root(parent, v[i])
+        if root_u == root_v:
+            continue # Edge would form a cycle
+        # Union by rank
+        if rank[root_u] < rank[root_v]:
+            parent[root_u] = root_v
+        elif rank[root_u] > rank[root_v]:
+            parent[root_v] = root_u
+        else:
+            parent[root_v] = root_u
+            rank[root_u] += 1
+        out_w[count] = w[i]
+        out_u[count] = u[i]
+        out_v[count] = v[i]
+        count += 1
+        total_weight += w[i]
+        if count == n - 1: # Early termination: MST is complete when it has n-1 edges
+            break
+    return count, total_weight
+
+
+try:
+    import kruskal_cy # Compiled with: cythonize -i kruskal_cy.pyx
+except ImportError:
+    kruskal_cy = None
+
+if kruskal_cy is not None and not HAVE_NUMBA:
+    _kruskal_core = kruskal_cy.kruskal_core
+
+
+def _sort_order(w: np.ndarray) -> np.ndarray:
+    """Stable argsort of edge weights; O(m) radix sort when the weight range is small."""
+    if w.size == 0:
+        return np.argsort(w, kind='stable')
+    lo = int(w.min())
+    span = int(w.max()) - lo
+    # NumPy's stable sort is a radix sort for 8/16-bit keys, so shift the weights into that range
+    if span <= np.iinfo(np.uint8).max:
+        return np.argsort((w - lo).astype(np.uint8), kind='stable')
+    if span <= np.iinfo(np.uint16).max:
+        return np.argsort((w - lo).astype(np.uint16), kind='stable')
+    return np.argsort(w, kind='stable')
+
+
+def _rcm_permutation(n: int, w: np.ndarray, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Reverse Cuthill-McKee vertex order of the graph formed by the ~8n lightest edges."""
+    k = min(8 * n, len(w))
+    if k < len(w):
+        light = np.flatnonzero(w <= np.partition(w, k)[k])
+    else:
+        light = np.arange(len(w))
+    ones = np.ones(len(light), dtype=np.bool_) # Structure only; bool cannot wrap on parallel edges
+    structure = coo_matrix((ones, (u[light], v[light])), shape=(n, n)).tocsr()
+    return reverse_cuthill_mckee(structure, symmetric_mode=False).astype(np.int32)
+
+
+def _make_kruskal(max_weight: int) -> Callable:
+    """Build a Kruskal kernel specialized to integer weights in [0, max_weight].
+
+    The bucket count is a compile-time constant of the returned kernel, which sorts
+    with a counting sort instead of a comparison sort. Like kruskal_mst it only
+    buckets the lightest ~k edges first and widens the weight range until the MST
+    is complete. Same contract as _kruskal_core, starting from an empty MST.
+    The kernel does no bounds checks: callers (kruskal_mst) must guarantee
+    0 <= w <= max_weight and valid endpoints.
+    """
+    buckets = max_weight + 1
+
+    @njit(cache=True)
+    def kruskal_bounded(w: np.ndarray, u: np.ndarray, v: np.ndarray,
+                        parent: np.ndarray, rank: np.ndarray, n: int,
+                        out_w: np.ndarray, out_u: np.ndarray, out_v: np.ndarray) -> Tuple[int, int]:
+        m = w.shape[0]
+        counts = np.zeros(buckets, dtype=np.int64)
+        for i in range(m):
+            counts[w[i]] += 1
+
+        k = int(4 * n * math.log2(max(n, 2)))
+        count = 0
+        total_weight = np.int64(0)
+        lo = 0 # Weights below lo have already been scanned
+        while lo < buckets and count < n - 1:
+            # Widen [lo, hi] until it holds at least k edges
+            hi = lo
+            size = counts[lo]
+            while hi + 1 < buckets and size < k:
+                hi += 1
+                size += counts[hi]
+            offsets = np.empty(hi - lo + 1, dtype=np.int64)
+            start = 0
+            for b in range(lo, hi + 1):
+                offsets[b - lo] = start
+                start += counts[b]
+
+            # Stable counting-sort scatter of the edges with weight in [lo, hi]
+            w_run = np.empty(size, dtype=np.int32)
+            u_run = np.empty(size, dtype=np.int32)
+            v_run = np.empty(size, dtype=np.int32)
+            for i in range(m):
+                wi = w[i]
+                if lo <= wi <= hi:
+                    pos = offsets[wi - lo]
+                    offsets[wi - lo] = pos + 1
+                    w_run[pos] = wi
+                    u_run[pos] = u[i]
+                    v_run[pos] = v[i]
+            count, added = _kruskal_core(w_run, u_run, v_run, parent, rank, n,
+                                         out_w, out_u, out_v, count)
+            total_weight += added
+            lo = hi + 1
+            k *= 2
+        return count, total_weight
+
+    return kruskal_bounded
+
+
+_kruskal_small = _make_kruskal(100) # Experiments draw weights from [1, 100]
+
+# Specialized kernels by inclusive weight bound, smallest first
+_BOUNDED_KERNELS: List[Tuple[int, Callable]] = [(100, _kruskal_small)]
+
+
+def _kruskal_cuda(w: np.ndarray, u: np.ndarray, v: np.ndarray) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], int]:
+    """Minimum spanning forest on the GPU via cuGraph; same return shape as kruskal_mst.
+
+    Ties between equal weights may be broken differently from the CPU path, so the
+    edges can differ while the total weight is the same. Only exercised against a
+    stubbed cudf/cugraph in the tests; it has not been run on real RAPIDS/GPU hardware.
+    """
+    # cuGraph's MST works on floating-point edge weights
+    frame = cudf.DataFrame({'src': u, 'dst': v, 'w': np.asarray(w, dtype=np.float64)})
+    graph = cugraph.Graph()
+    graph.from_cudf_edgelist(frame, source='src', destination='dst', edge_attr='w')
+    edge_list = cugraph.minimum_spanning_tree(graph).view_edge_list()
+    mst_w = np.rint(edge_list['w'].to_numpy()).astype(np.int32)
+    mst_u = edge_list['src'].to_numpy().astype(np.int32)
+    mst_v = edge_list['dst'].to_numpy().astype(np.int32)
+    return (mst_w, mst_u, mst_v), int(mst_w.sum(dtype=np.int64))
 
-#Kruskal's algorithm to find the Minimum Spanning Tree (MST) of a graph
-def kruskal_mst(n: int, edges: List[Tuple[int, int, int]]) -> Tuple[List[Tuple[int, int, int]], int]:
 
-    edges.sort(key=lambda x: x[0])  # Sort by weight O(m log n)
-    
-    # Initialize empty MST and weight accumulator
-    T = []
+#Kruskal's algorithm to find the Minimum Spanning Tree (MST) of a graph
+def kruskal_mst(n: int, w: np.ndarray, u: np.ndarray, v: np.ndarray,
+                relabel: bool = False, backend: str = 'cpu') -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], int]:
+
+    if backend not in ('cpu', 'cuda'):
+        raise ValueError(f"Unknown backend: {backend!r}")
+    if backend == 'cuda' and relabel:
+        raise ValueError("relabel is only supported by the 'cpu' backend")
+    w = np.asarray(w)
+    u = np.asarray(u)
+    v = np.asarray(v)
+    m = len(w)
+    # The kernels store weights as int32; reject anything that cast would truncate or wrap
+    if m > 0 and not np.issubdtype(w.dtype, np.integer):
+        raise ValueError(f"Edge weights must be integers, got dtype {w.dtype}")
+    int32 = np.iinfo(np.int32)
+    if m > 0 and (int(w.min()) < int32.min or int(w.max()) > int32.max):
+        raise ValueError("Edge weights must fit in int32")
+    # The compiled kernels do no bounds checks, so endpoints must be valid vertex indices
+    if len(u) != m or len(v) != m:
+        raise ValueError(f"w, u and v must have the same length, got {m}, {len(u)}, {len(v)}")
+    if m > 0:
+        if not (np.issubdtype(u.dtype, np.integer) and np.issubdtype(v.dtype, np.integer)):
+            raise ValueError("Edge endpoints must be integers")
+        if min(int(u.min()), int(v.min())) < 0 or max(int(u.max()), int(v.max())) >= n:
+            raise ValueError(f"Edge endpoints must be in [0, {n})")
+
+    # GPU backend for very large graphs (needs cuGraph); otherwise use the CPU kernels
+    if backend == 'cuda' and cugraph is not None and n > 1 and m > 0:
+        return _kruskal_cuda(w, u, v)
+
+    # Optionally relabel vertices in RCM order so that edges mostly join nearby
+    # indices (needs SciPy). Measured net slower on every input tried so far: ~4x on
+    # the complete benchmark graphs (n=2000: 8 -> 34 ms, n=5000: 65 -> 207 ms) and ~2x
+    # on random sparse graphs with 8n edges; the RCM pass costs more than the cache gain.
+    perm = None
+    if relabel and reverse_cuthill_mckee is not None and n > 1 and m > 0:
+        perm = _rcm_permutation(n, w, u, v)
+        label = np.empty(n, dtype=np.int32)
+        label[perm] = np.arange(n, dtype=np.int32)
+        u = label[u]
+        v = label[v]
+
+    # Union-Find buffers and MST output buffers
+    parent = np.arange(n, dtype=np.int32)
+    rank = np.zeros(n, dtype=np.uint8)
+    size = max(n - 1, 0)
+    out_w = np.empty(size, dtype=np.int32)
+    out_u = np.empty(size, dtype=np.int32)
+    out_v = np.empty(size, dtype=np.int32)
+    count = 0
     total_weight = 0
-    
-    uf = UnionFind(n)
-
-    for weight, u, v in edges:
-        if uf.find(u) != uf.find(v): 
-            T.append((weight, u, v)) #Edge added to the MST since no cycle is formed
-            total_weight += weight
-            uf.union(u, v) # Merge the components containing u and v to avoid cycle formation
-
-            if len(T) == n - 1: # Early termination: MST is complete when it has n-1 edges
-                return T, total_weight
-
-    # Returns MST was built (may be partial if graph is disconnected)
-    return T, total_weight
-
-
-def generate_graph(n: int) -> List[Tuple[int, int, int]]:
-    """Generate complete graph with n vertices and random weights."""
-    edges = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            edges.append((random.randint(1, 100), i, j))
-    return edges
 
+    max_weight = int(w.max()) if m > 0 else 0
+    bounded = None
+    if HAVE_NUMBA and m > 0 and int(w.min()) >= 0:
+        bounded = next((kernel for bound, kernel in _BOUNDED_KERNELS if max_weight <= bound), None)
 
+    if bounded is not None:
+        count, total_weight = bounded(np.ascontiguousarray(w, dtype=np.int32),
+                                      np.ascontiguousarray(u, dtype=np.int32),
+                                      np.ascontiguousarray(v, dtype=np.int32),
+                                      parent, rank, n, out_w, out_u, out_v)
+    else:
+        # The MST usually completes within a short prefix of the sorted edges, so only the
+        # lightest ~k edges are selected and sorted; k doubles until the MST is complete.
+        k = int(4 * n * math.log2(max(n, 2)))
+        done_weight = None # Edges with weight <= done_weight have already been scanned
+        while count < n - 1 and m > 0:
+            if k < m:
+                threshold = int(np.partition(w, k)[k])
+            else:
+                threshold = max_weight
+            mask = w <= threshold
+            if done_weight is not None:
+                mask &= w > done_weight
+            sel = np.flatnonzero(mask) # Keeps input order, so ties stay stable across rounds
+
+            # Sort by weight: O(m) for small weight ranges, O(m log n) otherwise; stable so ties keep input order
+            order = sel[_sort_order(w[sel])]
+            w_run = np.ascontiguousarray(w[order], dtype=np.int32)
+            u_run = np.ascontiguousarray(u[order], dtype=np.int32)
+            v_run = np.ascontiguousarray(v[order], dtype=np.int32)
+            count, added = _kruskal_core(w_run, u_run, v_run, parent, rank, n,
+                                         out_w, out_u, out_v, count)
+            total_weight += int(added)
+            if threshold >= max_weight:
+                break # Every edge has been scanned
+            done_weight = threshold
+            k *= 2
+
+    if perm is not None: # Map MST endpoints back to the caller's vertex labels
+        out_u[:count] = perm[out_u[:count]]
+        out_v[:count] = perm[out_v[:count]]
+
+    # Returns MST edges as (w, u, v) arrays (may be partial if graph is disconnected)
+    return (out_w[:count], out_u[:count], out_v[:count]), int(total_weight)
+
+
+def edges_to_arrays(edges: List[Tuple[int, int, int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a list of (weight, u, v) tuples into parallel int32 arrays (w, u, v)."""
+    arr = np.array(edges, dtype=np.int32).reshape(-1, 3)
+    return (np.ascontiguousarray(arr[:, 0]),
+            np.ascontiguousarray(arr[:, 1]),
+            np.ascontiguousarray(arr[:, 2]))
+
+
+def arrays_to_edges(w: np.ndarray, u: np.ndarray, v: np.ndarray) -> List[Tuple[int, int, int]]:
+    """Join parallel (w, u, v) arrays back into a list of (weight, u, v) tuples."""
+    return list(zip(w.tolist(), u.tolist(), v.tolist()))
+
+
+def generate_graph(n: int, chunk: int = 1 << 20) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Generate complete graph with n vertices and random weights as (w, u, v) arrays.
+
+    The int32 buffers are filled in place (weights in chunks of `chunk`, endpoints one
+    row of pairs i < j at a time), so no int64 or Python-object temporaries of size m
+    are created.
+    """
+    m = n * (n - 1) // 2
+    w = np.empty(m, dtype=np.int32)
+    u = np.empty(m, dtype=np.int32)
+    v = np.empty(m, dtype=np.int32)
+    for start in range(0, m, chunk):
+        stop = min(start + chunk, m)
+        w[start:stop] = np.random.randint(1, 101, size=stop - start, dtype=np.int32)
+    columns = np.arange(n, dtype=np.int32)
+    start = 0
+    for i in range(n - 1): # Row i holds the pairs (i, i+1) .. (i, n-1)
+        stop = start + n - 1 - i
+        u[start:stop] = i
+        v[start:stop] = columns[i + 1:]
+        start = stop
+    return w, u, v
+
+
+@functools.lru_cache(maxsize=None)
 def theoretical_units_graph(n: int) -> float: # Theoretical units: m log n for a graph with n vertices
-    m = n*(n-1)//2
-    return float(m) * math.log2(n)
+    return n * (n - 1) // 2 * math.log2(n) # m converts to float exactly while m < 2**53 (n < ~1.3e8)
 
 
 def experimental_time_graph(n: int) -> Tuple[int, int]: # Runtime in ns, returns (time, edge_count)
-    edges = generate_graph(n)
-    gc.collect()
+    w, u, v = generate_graph(n)
     start = time.perf_counter_ns()
-    _ = kruskal_mst(n, edges)
+    _ = kruskal_mst(n, w, u, v)
     elapsed = time.perf_counter_ns() - start
-    return elapsed, len(edges)
+    return elapsed, len(w)
 
 
 def analyze_linear_graphs(n_values: List[int]) -> None:
@@ -102,20 +401,30 @@ def analyze_linear_graphs(n_values: List[int]) -> None:
     theory_units: List[float] = []
     edges_counts: List[int] = []
     
-    for n in n_values:
-        exp_ns, m = experimental_time_graph(n)
-        th_units = theoretical_units_graph(n)
-        exp_times.append(exp_ns)
-        theory_units.append(th_units)
-        edges_counts.append(m)  # Use actual edge count from graph generation
+    # Compile the Numba kernels on a tiny graph first, so JIT time is not timed as the first data point
+    kruskal_mst(4, *generate_graph(4))
+
+    # Keep the cyclic GC out of the timed runs; collect once after the whole sweep
+    gc.disable()
+    try:
+        for n in n_values:
+            exp_ns, m = experimental_time_graph(n)
+            th_units = theoretical_units_graph(n)
+            exp_times.append(exp_ns)
+            theory_units.append(th_units)
+            edges_counts.append(m)  # Use actual edge count from graph generation
+    finally:
+        gc.enable()
+        gc.collect()
     
-    # Calculate scaling constant C using least squares method
-    numerator = sum(e * t for e, t in zip(exp_times, theory_units))
-    denominator = sum(t * t for t in theory_units)
-    scale = (numerator / denominator) if denominator > 0 else 0.0
+    # Calculate scaling constant C using least squares method: C = Σ(e·t) / Σ(t²)
+    exp_arr = np.asarray(exp_times, dtype=np.float64)
+    theory_arr = np.asarray(theory_units, dtype=np.float64)
+    denominator = float(theory_arr @ theory_arr)
+    scale = (float(exp_arr @ theory_arr) / denominator) if denominator > 0 else 0.0
+    adj_theory_ns = (scale * theory_arr).astype(np.int64).tolist()
     
-    for n, m, exp_ns, th_units in zip(n_values, edges_counts, exp_times, theory_units):
-        adj_theory = int(scale * th_units)
+    for n, m, exp_ns, th_units, adj_theory in zip(n_values, edges_counts, exp_times, theory_units, adj_theory_ns):
         ratio = (exp_ns / adj_theory) if adj_theory > 0 else float('inf')
         print(f"{n:<6} {m:<8} {exp_ns:<15} {th_units:<12.4f} {scale:<12.6f} {adj_theory:<15} {ratio:<8.4f}")
     
@@ -123,8 +432,7 @@ def analyze_linear_graphs(n_values: List[int]) -> None:
     print(f"Scaling constant: {scale:.6f}")
     
     # Plot the results with least squares scaled theoretical values
-    theo_scaled = [scale * th for th in theory_units]
-    plot_results(n_values, exp_times, [int(t) for t in theo_scaled])
+    plot_results(n_values, exp_times, adj_theory_ns)
 
 
 def plot_results(ns: List[int], exp_times_ns: List[int], adjusted_theory_ns: List[int]) -> None:
@@ -143,14 +451,17 @@ def plot_results(ns: List[int], exp_times_ns: List[int], adjusted_theory_ns: Lis
 class TestUnionFind(unittest.TestCase):
     def test_initialization(self):
         uf = UnionFind(5)
-        self.assertEqual(uf.parent, [0, 1, 2, 3, 4])
-        self.assertEqual(uf.rank, [0, 0, 0, 0, 0])
+        self.assertEqual(uf.parent.tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(uf.rank.tolist(), [0, 0, 0, 0, 0])
+        self.assertEqual(uf.parent.dtype, np.int32)
+        self.assertEqual(uf.rank.dtype, np.uint8)
 
     def test_find_single_element(self):
         uf = UnionFind(3)
         self.assertEqual(uf.find(0), 0)
         self.assertEqual(uf.find(1), 1)
         self.assertEqual(uf.find(2), 2)
+        self.assertIs(type(uf.find(2)), int)
 
     def test_union_different_elements(self):
         uf = UnionFind(3)
@@ -191,6 +502,15 @@ class TestUnionFind(unittest.TestCase):
         self.assertEqual(uf.find(0), uf.find(2))
         self.assertEqual(uf.find(0), uf.find(3))
 
+    def test_link_roots(self):
+        uf = UnionFind(4)
+        uf.link(0, 1)
+        uf.link(2, 3)
+        uf.link(uf.find(3), uf.find(1)) # Equal ranks: second root is attached to the first
+        self.assertEqual(uf.parent[0], 2)
+        self.assertEqual(uf.rank[2], 2)
+        self.assertEqual(len({uf.find(i) for i in range(4)}), 1)
+
     def test_complex_union_sequence(self):
         uf = UnionFind(6)
         # Union sequence: (0,1), (2,3), (4,5), (1,3), (3,5)
@@ -205,19 +525,29 @@ class TestUnionFind(unittest.TestCase):
         for i in range(6):
             self.assertEqual(uf.find(i), root)
 
+    def test_find_long_chain(self):
+        n = 100000
+        uf = UnionFind(n)
+        # Degenerate chain deeper than the recursion limit: i -> i - 1
+        uf.parent = np.maximum(np.arange(n, dtype=np.int32) - 1, 0)
+        self.assertEqual(uf.find(n - 1), 0)
+        self.assertEqual(uf.find(n // 2), 0)
+
 
 class TestKruskalMST(unittest.TestCase):
     def test_single_vertex(self):
         n = 1
         edges: List[Tuple[int, int, int]] = []
-        mst, total = kruskal_mst(n, edges)
+        mst_arrays, total = kruskal_mst(n, *edges_to_arrays(edges))
+        mst = arrays_to_edges(*mst_arrays)
         self.assertEqual(mst, [])
         self.assertEqual(total, 0)
 
     def test_two_vertices_single_edge(self):
         n = 2
         edges = [(10, 0, 1)]
-        mst, total = kruskal_mst(n, edges)
+        mst_arrays, total = kruskal_mst(n, *edges_to_arrays(edges))
+        mst = arrays_to_edges(*mst_arrays)
         self.assertEqual(len(mst), 1)
         self.assertEqual(total, 10)
         self.assertEqual(mst[0], (10, 0, 1))
@@ -225,7 +555,8 @@ class TestKruskalMST(unittest.TestCase):
     def test_two_vertices_two_edges_parallel(self):
         n = 2
         edges = [(50, 0, 1), (5, 0, 1)]
-        mst, total = kruskal_mst(n, edges)
+        mst_arrays, total = kruskal_mst(n, *edges_to_arrays(edges))
+        mst = arrays_to_edges(*mst_arrays)
         self.assertEqual(len(mst), 1)
         self.assertEqual(total, 5)
         self.assertEqual(mst[0], (5, 0, 1))
@@ -233,7 +564,8 @@ class TestKruskalMST(unittest.TestCase):
     def test_three_vertices_triangle(self):
         n = 3
         edges = [(3, 0, 2), (1, 0, 1), (2, 1, 2)]
-        mst, total = kruskal_mst(n, edges)
+        mst_arrays, total = kruskal_mst(n, *edges_to_arrays(edges))
+        mst = arrays_to_edges(*mst_arrays)
         self.assertEqual(len(mst), 2)
         self.assertEqual(total, 3)
         self.assertIn((1, 0, 1), mst)
@@ -246,14 +578,190 @@ class TestKruskalMST(unittest.TestCase):
             (2, 1, 2), (6, 1, 3),
             (5, 2, 3),
         ]
-        mst, total = kruskal_mst(n, edges)
+        mst_arrays, total = kruskal_mst(n, *edges_to_arrays(edges))
+        mst = arrays_to_edges(*mst_arrays)
         self.assertEqual(len(mst), 3)
         self.assertEqual(total, 1 + 2 + 4)
 
+    def test_sort_order_matches_argsort(self):
+        rng = np.random.default_rng(7)
+        for lo, hi in [(1, 101), (-5, 5), (0, 60000), (0, 1 << 30)]:
+            w = rng.integers(lo, hi, size=1000).astype(np.int32)
+            np.testing.assert_array_equal(_sort_order(w), np.argsort(w, kind='stable'))
+
+    def test_prefix_rounds_match_full_sort(self):
+        # Many more edges than the initial prefix guess, forcing several selection rounds
+        n = 60
+        rng = np.random.default_rng(3)
+        iu, iv = np.triu_indices(n, 1)
+        w = rng.integers(1, 1000, size=iu.size).astype(np.int32)
+        w[iv == n - 1] += 1000 # Last vertex is only reachable through the heaviest edges
+        (mst_w, _, _), total = kruskal_mst(n, w, iu.astype(np.int32), iv.astype(np.int32))
+
+        uf = UnionFind(n)
+        expected = 0
+        for i in np.argsort(w, kind='stable'):
+            root_u, root_v = uf.find(int(iu[i])), uf.find(int(iv[i]))
+            if root_u != root_v:
+                uf.link(root_u, root_v)
+                expected += int(w[i])
+        self.assertEqual(len(mst_w), n - 1)
+        self.assertEqual(total, expected)
+
+    @unittest.skipIf(kruskal_cy is None, "Cython extension not built")
+    def test_cython_core_matches(self):
+        np.random.seed(5)
+        n = 50
+        w, u, v = generate_graph(n)
+        order = np.argsort(w, kind='stable')
+        w, u, v = w[order], u[order], v[order]
+        results = []
+        for core in (kruskal_cy.kruskal_core, _kruskal_core):
+            out = [np.empty(n - 1, dtype=np.int32) for _ in range(3)]
+            count, total = core(w, u, v, np.arange(n, dtype=np.int32),
+                                np.zeros(n, dtype=np.uint8), n, *out, 0)
+            results.append((count, int(total), [o.tolist() for o in out]))
+        self.assertEqual(results[0], results[1])
+
+    @unittest.skipIf(reverse_cuthill_mckee is None, "SciPy not installed")
+    def test_rcm_relabel_many_parallel_edges(self):
+        # 200 parallel copies of each edge must not overflow the structure matrix
+        w = np.arange(400, dtype=np.int32)
+        u = np.tile(np.array([0, 1], dtype=np.int32), 200)
+        v = np.tile(np.array([1, 2], dtype=np.int32), 200)
+        mst, total = kruskal_mst(3, w, u, v, relabel=True)
+        self.assertEqual(arrays_to_edges(*mst), [(0, 0, 1), (1, 1, 2)])
+        self.assertEqual(total, 1)
+
+    @unittest.skipIf(reverse_cuthill_mckee is None, "SciPy not installed")
+    def test_rcm_relabel_same_mst(self):
+        np.random.seed(11)
+        n = 80
+        w, u, v = generate_graph(n)
+        mst_relabel, total_relabel = kruskal_mst(n, w, u, v, relabel=True)
+        mst, total = kruskal_mst(n, w, u, v)
+        self.assertEqual(arrays_to_edges(*mst_relabel), arrays_to_edges(*mst))
+        self.assertEqual(total_relabel, total)
+
+    def test_bounded_kernel_matches_reference(self):
+        n = 60
+        rng = np.random.default_rng(4)
+        iu, iv = np.triu_indices(n, 1)
+        u, v = iu.astype(np.int32), iv.astype(np.int32)
+        w = rng.integers(0, 50, size=iu.size).astype(np.int32)
+        w[iv == n - 1] = 100 # Forces a second, wider weight range
+
+        uf = UnionFind(n)
+        expected = []
+        for i in np.argsort(w, kind='stable'):
+            if uf.union(int(u[i]), int(v[i])):
+                expected.append((int(w[i]), int(u[i]), int(v[i])))
+
+        out = [np.empty(n - 1, dtype=np.int32) for _ in range(3)]
+        count, total = _kruskal_small(w, u, v, np.arange(n, dtype=np.int32),
+                                     np.zeros(n, dtype=np.uint8), n, *out)
+        self.assertEqual(arrays_to_edges(*out)[:count], expected)
+        self.assertEqual(total, sum(e[0] for e in expected))
+        mst, total = kruskal_mst(n, w, u, v)
+        self.assertEqual(arrays_to_edges(*mst), expected)
+
+    def test_empty_list_inputs(self):
+        (mst_w, mst_u, mst_v), total = kruskal_mst(1, [], [], [])
+        self.assertEqual(len(mst_w), 0)
+        self.assertEqual(total, 0)
+
+    def test_rejects_non_integer_weights(self):
+        with self.assertRaises(ValueError):
+            kruskal_mst(3, np.array([0.3, 0.7]), np.array([0, 1]), np.array([1, 2]))
+        with self.assertRaises(ValueError):
+            kruskal_mst(2, np.array([2 ** 40]), np.array([0]), np.array([1]))
+
+    def test_rejects_invalid_endpoints(self):
+        w = np.array([1, 2, 3], dtype=np.int32)
+        with self.assertRaises(ValueError):
+            kruskal_mst(3, w, np.array([0]), np.array([1, 2, 2]))
+        with self.assertRaises(ValueError):
+            kruskal_mst(2, np.array([1]), np.array([0]), np.array([10 ** 6]))
+        with self.assertRaises(ValueError):
+            kruskal_mst(2, np.array([1]), np.array([-1]), np.array([1]))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            kruskal_mst(2, *edges_to_arrays([(1, 0, 1)]), backend='tpu')
+
+    def test_cuda_backend_with_stubbed_cugraph(self):
+        # Checks the cuDF frame construction and result column mapping without a GPU
+        calls = {}
+
+        class FakeColumn:
+            def __init__(self, values):
+                self.values = values
+
+            def to_numpy(self):
+                return self.values
+
+        class FakeGraph:
+            def from_cudf_edgelist(self, frame, source, destination, edge_attr):
+                calls['frame'] = frame
+                calls['names'] = (source, destination, edge_attr)
+
+        # Fixed cuGraph-style result: float weights (one slightly off an integer), columns out of order
+        edge_list = {
+            'dst': FakeColumn(np.array([1, 3, 2], dtype=np.int64)),
+            'w': FakeColumn(np.array([1.0, 2.9999999, 4.0])),
+            'src': FakeColumn(np.array([0, 1, 0], dtype=np.int64)),
+        }
+        fake_cudf = types.SimpleNamespace(DataFrame=dict)
+        fake_cugraph = types.SimpleNamespace(
+            Graph=FakeGraph,
+            minimum_spanning_tree=lambda graph: types.SimpleNamespace(view_edge_list=lambda: edge_list))
+
+        w, u, v = edges_to_arrays([(1, 0, 1), (4, 0, 2), (3, 1, 3), (9, 2, 3)])
+        with mock.patch.dict(globals(), {'cudf': fake_cudf, 'cugraph': fake_cugraph}):
+            mst, total = kruskal_mst(4, w, u, v, backend='cuda')
+        self.assertEqual(calls['names'], ('src', 'dst', 'w'))
+        self.assertEqual(calls['frame']['w'].dtype, np.float64)
+        self.assertEqual(calls['frame']['w'].tolist(), [1.0, 4.0, 3.0, 9.0])
+        self.assertEqual(calls['frame']['src'].tolist(), [0, 0, 1, 2])
+        self.assertEqual(calls['frame']['dst'].tolist(), [1, 2, 3, 3])
+        self.assertEqual(arrays_to_edges(*mst), [(1, 0, 1), (3, 1, 3), (4, 0, 2)])
+        self.assertEqual(total, 8)
+        for arr in mst:
+            self.assertEqual(arr.dtype, np.int32)
+
+    def test_cuda_backend_rejects_relabel(self):
+        with self.assertRaises(ValueError):
+            kruskal_mst(2, *edges_to_arrays([(1, 0, 1)]), relabel=True, backend='cuda')
+
+    @unittest.skipIf(cugraph is None, "cuGraph not installed; the cuda backend is untested here")
+    def test_cuda_backend_total_weight(self):
+        np.random.seed(13)
+        n = 100
+        w, u, v = generate_graph(n)
+        mst, total = kruskal_mst(n, w, u, v, backend='cuda')
+        self.assertEqual(len(mst[0]), n - 1)
+        self.assertEqual(total, kruskal_mst(n, w, u, v)[1])
+
+    def test_core_python_fallback_large_weights(self):
+        # The interpreted kernel (no Numba) must not wrap the int32 weight sum
+        core = getattr(_kruskal_core, 'py_func', _kruskal_core)
+        n = 4
+        w = np.full(3, 2 ** 30, dtype=np.int32)
+        u = np.array([0, 1, 2], dtype=np.int32)
+        v = np.array([1, 2, 3], dtype=np.int32)
+        out = [np.empty(n - 1, dtype=np.int32) for _ in range(3)]
+        with np.errstate(over='raise'):
+            count, total = core(w, u, v, np.arange(n, dtype=np.int32),
+                                np.zeros(n, dtype=np.uint8), n, *out, 0)
+        self.assertEqual(count, 3)
+        self.assertEqual(int(total), 3 * 2 ** 30)
+        self.assertEqual(kruskal_mst(n, w, u, v)[1], 3 * 2 ** 30)
+
     def test_disconnected_vertices(self):
         n = 4
         edges = [(2, 0, 1), (3, 1, 2)]
-        mst, total = kruskal_mst(n, edges)
+        mst_arrays, total = kruskal_mst(n, *edges_to_arrays(edges))
+        mst = arrays_to_edges(*mst_arrays)
         self.assertEqual(len(mst), 2)
         self.assertEqual(total, 5)
 
@@ -263,13 +771,39 @@ class TestKruskalMST(unittest.TestCase):
             (10, 0, 1), (10, 1, 2), (10, 2, 3), (10, 3, 4),
             (10, 0, 2), (10, 1, 3), (10, 2, 4)
         ]
-        mst, total = kruskal_mst(n, edges)
+        mst_arrays, total = kruskal_mst(n, *edges_to_arrays(edges))
+        mst = arrays_to_edges(*mst_arrays)
         self.assertEqual(len(mst), 4)
         self.assertEqual(total, 40)
 
+    def test_generate_graph_complete(self):
+        n = 6
+        w, u, v = generate_graph(n)
+        self.assertEqual(len(w), n * (n - 1) // 2)
+        self.assertEqual(w.dtype, np.int32)
+        self.assertTrue(((w >= 1) & (w <= 100)).all())
+        self.assertTrue((u < v).all())
+        self.assertEqual(len(set(zip(u.tolist(), v.tolist()))), len(w))
+        self.assertTrue(u.flags.writeable and v.flags.writeable)
+
+    def test_generate_graph_chunked(self):
+        n = 40
+        iu, iv = np.triu_indices(n, 1)
+        w, u, v = generate_graph(n, chunk=7)
+        self.assertEqual(u.tolist(), iu.tolist())
+        self.assertEqual(v.tolist(), iv.tolist())
+        self.assertTrue(((w >= 1) & (w <= 100)).all())
+
+    def test_mst_output_arrays(self):
+        (mst_w, mst_u, mst_v), total = kruskal_mst(3, *edges_to_arrays([(3, 0, 2), (1, 0, 1), (2, 1, 2)]))
+        for arr in (mst_w, mst_u, mst_v):
+            self.assertEqual(arr.dtype, np.int32)
+        self.assertEqual(mst_w.tolist(), [1, 2])
+        self.assertEqual(int(mst_w.sum()), total)
+
     def test_experimental_analysis(self):
         n_values = [100, 200, 300, 400, 500]
-        random.seed(123)
+        np.random.seed(123)
         analyze_linear_graphs(n_values)
 
 
@@ -0,0 +1,62 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython build of the Kruskal main loop, for environments without Numba.
+
+Build in place with:  cythonize -i kruskal_cy.pyx
+Kruskal_algo.py picks this module up automatically when Numba is not installed.
+"""
+
+from libc.stdint cimport int32_t, int64_t, uint8_t
+
+
+cdef class UnionFind:
+    #Union-Find over caller-owned int32 parent / uint8 rank buffers.
+    cdef int32_t[::1] parent
+    cdef uint8_t[::1] rank
+
+    def __init__(self, int32_t[::1] parent, uint8_t[::1] rank):
+        self.parent = parent
+        self.rank = rank
+
+    cdef inline int find(self, int x) noexcept nogil: #Find root with path splitting.
+        cdef int next_x
+        while self.parent[x] != x:
+            next_x = self.parent[x]
+            self.parent[x] = self.parent[next_x]
+            x = next_x
+        return x
+
+    cdef inline void link(self, int root_a, int root_b) noexcept nogil: #Union two roots by rank.
+        if self.rank[root_a] < self.rank[root_b]:
+            self.parent[root_a] = root_b
+        elif self.rank[root_a] > self.rank[root_b]:
+            self.parent[root_b] = root_a
+        else:
+            self.parent[root_b] = root_a
+            self.rank[root_a] += 1
+
+
+def kruskal_core(const int32_t[::1] w, const int32_t[::1] u, const int32_t[::1] v,
+                 int32_t[::1] parent, uint8_t[::1] rank, int n,
+                 int32_t[::1] out_w, int32_t[::1] out_u, int32_t[::1] out_v,
+                 Py_ssize_t count):
+    """Same contract as Kruskal_algo._kruskal_core; returns (new count, weight added)."""
+    cdef UnionFind uf = UnionFind(parent, rank)
+    cdef int64_t total_weight = 0
+    cdef Py_ssize_t i, m = w.shape[0]
+    cdef int root_u, root_v
+    with nogil:
+        for i in range(m):
+            root_u = uf.find(u[i])
+            root_v = uf.find(v[i])
+            if root_u == root_v:
+                continue # Edge would form a cycle
+            uf.link(root_u, root_v)
+            out_w[count] = w[i]
+            out_u[count] = u[i]
+            out_v[count] = v[i]
+            count += 1
+            total_weight += w[i]
+            if count == n - 1: # Early termination: MST is complete when it has n-1 edges
+                break
+    return count, total_weight